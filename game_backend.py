@@ -27,14 +27,21 @@ import random
 
 class GameBackend:
     """Логика игры Судоку."""
-    def __init__(self, difficulty, size):
+    def __init__(self, difficulty, size, deadline=None, progress=None, cancel_event=None):
         """
         Инициализирует объект GameBackend и создаёт игровую сетку Судоку.
+
+        Args:
+            difficulty (str): Уровень сложности игры.
+            size (str): Размер сетки Судоку (например, '4x4' или '9x9').
+            deadline (float | None): Срок генерации по time.monotonic(); None — без ограничения.
+            progress (callable | None): Функция, получающая долю выполненной генерации (от 0 до 1).
+            cancel_event (threading.Event | None): Событие отмены генерации.
         """
         self.size = int(size.split('x')[0])
         self.difficulty = difficulty
         self.sudoku_generator = SudokuGenerator(self.size)
-        self.sudoku_grid = self.sudoku_generator.generate(difficulty)
+        self.sudoku_grid = self.sudoku_generator.generate(difficulty, deadline, progress, cancel_event)
         self.user_grid = [row[:] for row in self.sudoku_grid]  # Копия для пользовательского ввода
         self.hint_count = 0  # Счётчик использованных подсказок
 
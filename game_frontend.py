@@ -6,14 +6,32 @@
 
 Attributes:
     root (tk.Tk): Главное окно приложения.
-    backend (GameBackend): Объект, управляющий логикой игры.
+    difficulty (str): Уровень сложности игры.
+    size_name (str): Размер сетки в виде строки (например, '4x4' или '9x9').
+    backend (GameBackend | None): Объект, управляющий логикой игры (None, пока идёт генерация).
     size (int): Размер сетки (например, 4 или 9).
     entries (list[list[tk.Entry]]): Список виджетов ввода для каждой ячейки сетки.
     hint_button (tk.Button): Кнопка для получения подсказок.
+    generation_queue (queue.Queue): Очередь сообщений от потока генерации.
+    cancel_event (threading.Event): Событие отмены генерации.
+    loading_frame (tk.Frame | None): Экран загрузки, показываемый во время генерации.
+    progress_bar (ttk.Progressbar | None): Индикатор хода генерации.
 
 Methods:
     run():
-        Запускает главный цикл интерфейса.
+        Запускает генерацию и главный цикл интерфейса.
+    
+    start_generation():
+        Показывает экран загрузки и запускает генерацию судоку в отдельном потоке.
+    
+    poll_generation():
+        Проверяет сообщения от потока генерации и обновляет экран загрузки.
+    
+    cancel_generation():
+        Отменяет генерацию и возвращает пользователя в меню.
+    
+    close_window():
+        Отменяет генерацию и закрывает окно, завершая приложение.
     
     create_widgets():
         Создаёт виджеты интерфейса для отображения сетки и кнопок управления.
@@ -30,10 +48,16 @@ Methods:
     get_hint():
         Выбирает случайную пустую ячейку и заполняет её правильным значением.
 """
+import queue
+import threading
+import time
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 from game_backend import GameBackend
 
+GENERATION_TIMEOUT = 3  # Секунд на генерацию, после чего используется готовая сетка
+POLL_INTERVAL = 50  # Интервал опроса потока генерации, мс
+
 class GameFrontend:
     """Класс для визуализации интерфейса Судоку и обработки пользовательского ввода.""" 
     def __init__(self, difficulty, size):
@@ -46,23 +70,143 @@ class GameFrontend:
 
         Attributes:
             root (tk.Tk): Главное окно приложения.
-            backend (GameBackend): Объект, управляющий логикой игры.
+            difficulty (str): Уровень сложности игры.
+            size_name (str): Размер сетки в виде строки (например, '4x4' или '9x9').
+            backend (GameBackend | None): Объект, управляющий логикой игры (создаётся в потоке генерации).
             size (int): Размер сетки Судоку (4 или 9).
             entries (list[list[tk.Entry]]): Список виджетов ввода для каждой ячейки сетки.
             hint_button (tk.Button): Кнопка для получения подсказок.
+            generation_queue (queue.Queue): Очередь сообщений от потока генерации.
+            cancel_event (threading.Event): Событие отмены генерации.
+            loading_frame (tk.Frame | None): Экран загрузки, показываемый во время генерации.
+            progress_bar (ttk.Progressbar | None): Индикатор хода генерации.
         """
         self.root = tk.Tk()
         self.root.title(f"Судоку {size} — {difficulty}")
-        self.backend = GameBackend(difficulty, size)
+        self.difficulty = difficulty
+        self.size_name = size
+        self.backend = None  # Создаётся в потоке генерации
         self.size = int(size.split('x')[0])
         self.entries = []  # Матрица виджетов ввода для каждой ячейки
         self.hint_button = None  # Кнопка подсказки
+        self.generation_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.loading_frame = None  # Экран загрузки на время генерации
+        self.progress_bar = None
 
     def run(self):
-        """Запускает главный цикл интерфейса."""
-        self.create_widgets()
+        """Запускает генерацию судоку и главный цикл интерфейса."""
+        self.start_generation()
         self.root.mainloop()
 
+    def start_generation(self):
+        """
+        Показывает экран загрузки и запускает генерацию судоку в отдельном потоке.
+
+        Главный поток Tk не блокируется: о ходе генерации поток сообщает через очередь,
+        которую опрашивает poll_generation с помощью root.after.
+
+        Returns:
+            None
+        """
+        self.loading_frame = tk.Frame(self.root)
+        self.loading_frame.pack(padx=20, pady=20)
+
+        tk.Label(self.loading_frame, text="Генерация судоку...", font=('Arial', 12)).pack(pady=5)
+        self.progress_bar = ttk.Progressbar(self.loading_frame, length=200, maximum=1.0)
+        self.progress_bar.pack(pady=5)
+        tk.Button(self.loading_frame, text="Отмена", font=('Arial', 12), command=self.cancel_generation).pack(pady=5)
+
+        self.root.protocol("WM_DELETE_WINDOW", self.close_window)
+
+        worker = threading.Thread(target=self._generate, daemon=True)
+        worker.start()
+        self.root.after(POLL_INTERVAL, self.poll_generation)
+
+    def _generate(self):
+        """
+        Создаёт GameBackend в потоке генерации и передаёт результат в очередь.
+
+        Метод выполняется не в главном потоке, поэтому не обращается к виджетам Tk.
+        Если генерация завершилась ошибкой, в очередь передаётся сообщение 'error'.
+
+        Returns:
+            None
+        """
+        try:
+            backend = GameBackend(
+                self.difficulty,
+                self.size_name,
+                deadline=time.monotonic() + GENERATION_TIMEOUT,
+                progress=lambda fraction: self.generation_queue.put(('progress', fraction)),
+                cancel_event=self.cancel_event,
+            )
+        except Exception as error:
+            self.generation_queue.put(('error', error))
+            return
+        self.generation_queue.put(('done', backend))
+
+    def poll_generation(self):
+        """
+        Проверяет сообщения от потока генерации.
+
+        Обновляет индикатор прогресса; после завершения генерации убирает экран загрузки
+        и создаёт игровое поле. При ошибке генерации показывает сообщение и возвращает
+        пользователя в меню. Пока генерация идёт, метод снова планируется через root.after.
+
+        Returns:
+            None
+        """
+        if self.cancel_event.is_set():
+            return
+
+        while True:
+            try:
+                message, value = self.generation_queue.get_nowait()
+            except queue.Empty:
+                break
+            if message == 'progress':
+                self.progress_bar.config(value=value)
+            elif message == 'done':
+                self.backend = value
+                self.loading_frame.destroy()
+                self.root.protocol("WM_DELETE_WINDOW", self.root.destroy)
+                self.create_widgets()
+                return
+            elif message == 'error':
+                messagebox.showerror("Ошибка", f"Не удалось сгенерировать судоку: {value}")
+                self.cancel_generation()
+                return
+
+        self.root.after(POLL_INTERVAL, self.poll_generation)
+
+    def cancel_generation(self):
+        """
+        Отменяет генерацию, закрывает окно игры и возвращает пользователя в меню.
+
+        Окно меню к этому моменту уже закрыто (MenuFrontend.start_game), поэтому оно создаётся заново.
+
+        Returns:
+            None
+        """
+        from menu_frontend import MenuFrontend  # Локальный импорт: menu_frontend импортирует game_frontend
+
+        self.close_window()
+        MenuFrontend().run()
+
+    def close_window(self):
+        """
+        Отменяет генерацию и закрывает окно игры.
+
+        Вызывается при закрытии окна во время генерации: как и везде в приложении,
+        закрытие окна завершает его, а не возвращает в меню.
+
+        Returns:
+            None
+        """
+        self.cancel_event.set()
+        self.root.destroy()
+
     def create_widgets(self):
         """
         Создаёт виджеты интерфейса для отображения сетки и кнопок управления.
@@ -0,0 +1,169 @@
+"""
+Класс ParallelSolver решает одну сложную головоломку Судоку на нескольких ядрах процессора.
+
+Дерево перебора разбивается на первых нескольких пустых ячейках на независимые задания
+(сетки с уже подставленными числами). Задания раздаются пулу процессов по одному:
+освободившийся процесс сразу забирает следующее задание из общей очереди, поэтому все ядра
+остаются загружены. Как только одно из заданий даёт решение (или при подсчёте решений
+найдено достаточно), оставшиеся процессы останавливаются.
+
+Attributes:
+    processes (int): Количество процессов в пуле.
+    units_per_process (int): Сколько заданий в среднем приходится на один процесс.
+
+Methods:
+    solve(grid):
+        Находит решение сетки, используя пул процессов.
+
+    count_solutions(grid, limit):
+        Считает количество решений сетки (не больше limit), используя пул процессов.
+
+    _split(grid):
+        Разбивает дерево перебора на задания для пула процессов.
+"""
+import os
+from multiprocessing import Pool
+from sudoku_generator import SudokuGenerator
+
+
+def _solve_unit(grid):
+    """
+    Решает одно задание в процессе пула.
+
+    Args:
+        grid (list[list[int]]): Сетка с частично подставленными числами.
+
+    Returns:
+        list[list[int]] | None: Решённая сетка; None, если у задания нет решения.
+    """
+    generator = SudokuGenerator(len(grid))
+    generator.grid = grid
+    if generator._solve():
+        return generator.grid
+    return None
+
+
+def _count_unit(args):
+    """
+    Считает решения одного задания в процессе пула.
+
+    Args:
+        args (tuple[list[list[int]], int]): Сетка задания и максимальное количество решений.
+
+    Returns:
+        int: Количество найденных решений (не больше limit).
+    """
+    grid, limit = args
+    generator = SudokuGenerator(len(grid))
+    generator.grid = grid
+    return generator._count_solutions(limit)
+
+
+class ParallelSolver:
+    """Параллельный поиск решения Судоку в пуле процессов."""
+    def __init__(self, processes=None, units_per_process=4):
+        """
+        Инициализирует параллельный решатель.
+
+        Размер сетки определяется по самой сетке при каждом вызове.
+
+        Args:
+            processes (int | None): Количество процессов; по умолчанию — число ядер процессора.
+            units_per_process (int): Сколько заданий создавать на один процесс.
+                Чем больше заданий, тем ровнее распределяется нагрузка между ядрами.
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.units_per_process = units_per_process
+
+    def solve(self, grid):
+        """
+        Находит решение сетки Судоку, распределяя перебор по процессам.
+
+        Исходная сетка не изменяется. Как только какой-либо процесс находит решение,
+        остальные процессы пула останавливаются.
+
+        Args:
+            grid (list[list[int]]): Сетка Судоку, где 0 — пустая ячейка.
+
+        Returns:
+            list[list[int]] | None: Решённая сетка; None, если решения нет.
+        """
+        units = self._split(grid)
+        if not units:
+            return None
+
+        with Pool(min(self.processes, len(units))) as pool:
+            # chunksize=1: каждый свободный процесс забирает из очереди по одному заданию
+            for solution in pool.imap_unordered(_solve_unit, units, chunksize=1):
+                if solution is not None:
+                    return solution  # Выход из with останавливает остальные процессы
+        return None
+
+    def count_solutions(self, grid, limit=2):
+        """
+        Считает количество решений сетки Судоку, распределяя перебор по процессам.
+
+        Подсчёт прекращается, как только найдено limit решений: для проверки единственности
+        решения достаточно limit=2.
+
+        Args:
+            grid (list[list[int]]): Сетка Судоку, где 0 — пустая ячейка.
+            limit (int): Максимальное количество решений, которое нужно найти.
+
+        Returns:
+            int: Количество найденных решений (не больше limit).
+        """
+        units = self._split(grid)
+        if not units:
+            return 0
+
+        count = 0
+        with Pool(min(self.processes, len(units))) as pool:
+            tasks = ((unit, limit) for unit in units)
+            for unit_count in pool.imap_unordered(_count_unit, tasks, chunksize=1):
+                count += unit_count
+                if count >= limit:
+                    return limit  # Ответ уже известен — остальные процессы останавливаются
+        return count
+
+    def _split(self, grid):
+        """
+        Разбивает дерево перебора на задания для пула процессов.
+
+        Пустые ячейки раскрываются по очереди (в том же порядке, что и в SudokuGenerator._solve):
+        каждое задание заменяется копиями со всеми допустимыми числами в очередной ячейке,
+        пока заданий не станет достаточно для загрузки всех процессов.
+        Тупиковые ветви (без допустимых чисел) отбрасываются сразу.
+
+        Args:
+            grid (list[list[int]]): Сетка Судоку, где 0 — пустая ячейка.
+
+        Returns:
+            list[list[list[int]]]: Список сеток-заданий.
+        """
+        size = len(grid)
+        target = self.processes * self.units_per_process
+        units = [[row[:] for row in grid]]
+        generator = SudokuGenerator(size)
+
+        while len(units) < target:
+            expanded = []
+            for unit in units:
+                generator.grid = unit
+                empty_cell = generator._find_empty_cell()
+                if not empty_cell:
+                    expanded.append(unit)  # Задание уже решено
+                    continue
+                row, col = empty_cell
+                for num in range(1, size + 1):
+                    if generator._is_valid_placement(row, col, num):
+                        child = [r[:] for r in unit]
+                        child[row][col] = num
+                        expanded.append(child)
+            if expanded == units:
+                break  # Пустых ячеек не осталось — делить больше нечего
+            units = expanded
+            if not units:
+                break
+
+        return units
@@ -0,0 +1,348 @@
+"""
+Класс PuzzleIndex хранит головоломки Судоку по их канонической форме и кэширует результаты решения.
+
+Две головоломки считаются эквивалентными, если одна получается из другой перестановкой чисел,
+перестановками строк внутри полос и самих полос, перестановками столбцов внутри стопок
+и самих стопок, а также транспонированием. Каноническая форма — лексикографически наименьшая
+сетка среди всех эквивалентных (числа перенумеровываются в порядке первого появления).
+Эквивалентные головоломки имеют одну и ту же каноническую форму, поэтому решение,
+количество решений и сложность вычисляются для всего класса один раз.
+
+Attributes:
+    size (int): Размер сетки (например, 4 или 9).
+    region_size (int): Размер подрегиона (2 для 4x4, 3 для 9x9).
+    entries (dict): Словарь {каноническая форма: результаты решения или None}.
+
+Methods:
+    canonicalize(grid):
+        Возвращает каноническую форму сетки и преобразование, которое к ней приводит.
+
+    add(grid):
+        Добавляет головоломку в индекс; возвращает True, если её класс ещё не встречался.
+
+    deduplicate(puzzles):
+        Оставляет по одной головоломке из каждого класса эквивалентности.
+
+    solve(grid):
+        Возвращает решение, количество решений и сложность, используя кэш.
+
+    _apply(grid, transform):
+        Применяет преобразование к сетке.
+
+    _invert(grid, transform):
+        Применяет обратное преобразование к сетке.
+"""
+from itertools import permutations, product
+from sudoku_generator import SudokuGenerator
+
+class PuzzleIndex:
+    """Индекс головоломок Судоку по канонической форме с кэшем результатов решения."""
+    def __init__(self, size):
+        """
+        Инициализирует пустой индекс.
+
+        Args:
+            size (int): Размер сетки (например, 4 для 4x4 или 9 для 9x9).
+
+        Attributes:
+            size (int): Размер сетки.
+            region_size (int): Размер подрегиона (2 для 4x4, 3 для 9x9).
+            entries (dict): Словарь {каноническая форма: результаты решения или None}.
+        """
+        self.size = size
+        self.region_size = int(size ** 0.5)
+        self.entries = {}
+
+    def __len__(self):
+        """Возвращает количество различных классов головоломок в индексе."""
+        return len(self.entries)
+
+    def __contains__(self, grid):
+        """Проверяет, есть ли в индексе головоломка, эквивалентная grid."""
+        canonical, _ = self.canonicalize(grid)
+        return canonical in self.entries
+
+    def canonicalize(self, grid):
+        """
+        Находит каноническую форму сетки.
+
+        Первая строка после перенумерации определяется только расположением пустых ячеек
+        (числа в ней всегда идут как 1, 2, 3, ...), поэтому сначала выбираются строки, дающие
+        наименьшую первую строку, и только согласованные с ними порядки столбцов (_column_orders).
+        Для каждого такого порядка оставшиеся строки подбираются поиском с отсечением: ветвь
+        отбрасывается, как только построенные строки оказываются больше строк лучшей сетки.
+        Порядки столбцов с одинаковым содержимым и взаимозаменяемые строки не перебираются повторно.
+
+        Args:
+            grid (list[list[int]]): Сетка Судоку, где 0 — пустая ячейка.
+
+        Returns:
+            tuple: Пара (canonical, transform), где canonical — каноническая форма
+                (кортеж кортежей), а transform — кортеж (transposed, rows, cols, mapping),
+                переводящий grid в canonical методом _apply.
+        """
+        # Кандидаты на первую строку: (маска пустых ячеек, transposed, source, row)
+        n = self.region_size
+        starts = []
+        for transposed in (False, True):
+            source = [list(row) for row in zip(*grid)] if transposed else [list(row) for row in grid]
+            tried = set()
+            for row in range(self.size):
+                band = row // n
+                key = (tuple(source[row]), tuple(sorted(tuple(line) for line in source[band * n:band * n + n])))
+                if key in tried:
+                    continue  # Взаимозаменяемая строка уже рассмотрена
+                tried.add(key)
+                cols = next(self._column_orders(source[row]))
+                starts.append((tuple(1 if source[row][c] else 0 for c in cols), transposed, source, row))
+        first_mask = min(start[0] for start in starts)
+
+        best = None
+        best_transform = None
+        for mask, transposed, source, first_row in starts:
+            if mask != first_mask:
+                continue
+            columns = list(zip(*source))
+            seen = set()
+            for cols in self._column_orders(source[first_row]):
+                key = tuple(columns[c] for c in cols)  # Содержимое столбцов в этом порядке
+                if key in seen:
+                    continue  # Такой же результат уже был при другом порядке одинаковых столбцов
+                seen.add(key)
+                lines = [tuple(source[r][c] for c in cols) for r in range(self.size)]
+                result = self._best_row_order(lines, best, first_row)
+                if result is not None:
+                    best, rows, mapping = result
+                    best_transform = (transposed, rows, cols, mapping)
+
+        transposed, rows, cols, mapping = best_transform
+        return best, (transposed, rows, cols, self._complete_mapping(mapping))
+
+    def add(self, grid):
+        """
+        Добавляет головоломку в индекс.
+
+        Args:
+            grid (list[list[int]]): Сетка Судоку, где 0 — пустая ячейка.
+
+        Returns:
+            bool: True, если головоломка нового класса; False, если эквивалентная уже есть.
+        """
+        canonical, _ = self.canonicalize(grid)
+        if canonical in self.entries:
+            return False
+        self.entries[canonical] = None
+        return True
+
+    def deduplicate(self, puzzles):
+        """
+        Оставляет по одной головоломке из каждого класса эквивалентности.
+
+        Все головоломки добавляются в индекс.
+
+        Args:
+            puzzles (list[list[list[int]]]): Список сеток Судоку.
+
+        Returns:
+            list[list[list[int]]]: Головоломки, чей класс встретился впервые (в исходном порядке).
+        """
+        return [grid for grid in puzzles if self.add(grid)]
+
+    def solve(self, grid):
+        """
+        Возвращает результаты решения головоломки, используя кэш по канонической форме.
+
+        Если эквивалентная головоломка уже решалась, результат берётся из кэша, а решение
+        переводится обратно в координаты и числа исходной сетки. Иначе решается каноническая
+        форма, и результат сохраняется для всего класса.
+
+        Args:
+            grid (list[list[int]]): Сетка Судоку, где 0 — пустая ячейка.
+
+        Returns:
+            dict: Словарь с ключами:
+                'solution' (list[list[int]] | None) — решение исходной сетки;
+                'solution_count' (int) — количество решений (0, 1 или 2, где 2 означает «больше одного»);
+                'difficulty' (str) — уровень сложности ('Легкий' или 'Сложный').
+        """
+        canonical, transform = self.canonicalize(grid)
+        entry = self.entries.get(canonical)
+        if entry is None:
+            entry = self._solve_canonical(canonical)
+            self.entries[canonical] = entry
+
+        solution = entry['solution']
+        return {
+            'solution': self._invert(solution, transform) if solution else None,
+            'solution_count': entry['solution_count'],
+            'difficulty': entry['difficulty'],
+        }
+
+    def _solve_canonical(self, canonical):
+        """
+        Решает каноническую форму головоломки и определяет её сложность.
+
+        Сложность определяется по количеству пустых ячеек так же, как в
+        SudokuGenerator._remove_numbers: не больше половины — 'Легкий', иначе 'Сложный'.
+
+        Args:
+            canonical (tuple[tuple[int]]): Каноническая форма головоломки.
+
+        Returns:
+            dict: Словарь с ключами 'solution', 'solution_count' и 'difficulty'.
+        """
+        generator = SudokuGenerator(self.size)
+        generator.grid = [list(row) for row in canonical]
+        solutions = []  # Первое решение, найденное при подсчёте
+        solution_count = generator._count_solutions(2, solutions)
+        solution = tuple(tuple(row) for row in solutions[0]) if solutions else None
+
+        empty_cells = sum(row.count(0) for row in canonical)
+        difficulty = 'Легкий' if empty_cells <= self.size * self.size // 2 else 'Сложный'
+        return {'solution': solution, 'solution_count': solution_count, 'difficulty': difficulty}
+
+    def _best_row_order(self, lines, best, first_row):
+        """
+        Подбирает порядок строк, дающий наименьшую сетку при фиксированном порядке столбцов.
+
+        Строки выбираются по одной с соблюдением структуры полос; числа перенумеровываются
+        в порядке первого появления. Ветви, чьи построенные строки больше строк best, отсекаются.
+        Из строк с одинаковым содержимым (и, для начала полосы, одинаковыми полосами)
+        перебирается только одна.
+
+        Args:
+            lines (list[tuple[int]]): Строки сетки с уже переставленными столбцами.
+            best (tuple[tuple[int]] | None): Лучшая найденная сетка.
+            first_row (int): Строка, которая ставится первой.
+
+        Returns:
+            tuple | None: Тройка (grid, rows, mapping), если найдена сетка меньше best; иначе None.
+        """
+        n = self.region_size
+        found = None
+
+        def search(prefix, rows, mapping, next_label):
+            nonlocal best, found
+            depth = len(rows)
+            if depth == self.size:
+                if best is None or prefix < best:
+                    best = prefix
+                    found = (prefix, tuple(rows), mapping)
+                return
+
+            if depth == 0:
+                candidates = [first_row]
+            elif depth % n == 0:  # Начало новой полосы — подходит строка любой неиспользованной полосы
+                used_bands = {row // n for row in rows}
+                candidates = [row for row in range(self.size) if row // n not in used_bands]
+            else:  # Продолжаем полосу первой строки
+                band = rows[depth - depth % n] // n
+                candidates = [row for row in range(band * n, band * n + n) if row not in rows]
+
+            tried = set()
+            for row in candidates:
+                if depth % n == 0:
+                    band = row // n
+                    key = (lines[row], tuple(sorted(lines[band * n:band * n + n])))
+                else:
+                    key = lines[row]
+                if key in tried:
+                    continue  # Взаимозаменяемая строка уже перебиралась
+                tried.add(key)
+                new_mapping = dict(mapping)
+                label = next_label
+                relabeled = []
+                for num in lines[row]:
+                    if num and num not in new_mapping:
+                        new_mapping[num] = label
+                        label += 1
+                    relabeled.append(new_mapping[num] if num else 0)
+                candidate = prefix + (tuple(relabeled),)
+                if best is not None and candidate > best[:depth + 1]:
+                    continue  # Отсечение: эта ветвь уже хуже лучшей сетки
+                search(candidate, rows + [row], new_mapping, label)
+
+        search((), [], {}, 1)
+        return found
+
+    def _column_orders(self, row):
+        """
+        Перечисляет порядки столбцов, при которых строка row даёт наименьшую первую строку.
+
+        Наименьшая первая строка получается, когда пустые ячейки стоят как можно раньше:
+        стопки упорядочены по убыванию количества пустых ячеек в строке, а внутри стопки
+        пустые ячейки идут первыми. Перебираются только такие порядки.
+
+        Args:
+            row (list[int]): Строка, которая будет первой.
+
+        Yields:
+            tuple[int]: Порядок столбцов — кортеж исходных номеров столбцов.
+        """
+        n = self.region_size
+        inner_orders = []
+        for stack in range(n):
+            columns = range(stack * n, stack * n + n)
+            empty = [c for c in columns if not row[c]]
+            filled = [c for c in columns if row[c]]
+            inner_orders.append([e + f for e in permutations(empty) for f in permutations(filled)])
+
+        empty_counts = [sum(1 for c in range(stack * n, stack * n + n) if not row[c]) for stack in range(n)]
+        for stacks in permutations(range(n)):
+            counts = [empty_counts[stack] for stack in stacks]
+            if counts != sorted(counts, reverse=True):
+                continue
+            for inner in product(*(inner_orders[stack] for stack in stacks)):
+                yield tuple(c for order in inner for c in order)
+
+    def _complete_mapping(self, mapping):
+        """
+        Дополняет перенумерацию чисел, отсутствующих в головоломке, до полной перестановки.
+
+        Args:
+            mapping (dict[int, int]): Перенумерация чисел, встречающихся в головоломке.
+
+        Returns:
+            dict[int, int]: Перенумерация всех чисел от 1 до size.
+        """
+        mapping = dict(mapping)
+        free_labels = sorted(set(range(1, self.size + 1)) - set(mapping.values()))
+        missing = [num for num in range(1, self.size + 1) if num not in mapping]
+        mapping.update(zip(missing, free_labels))
+        return mapping
+
+    def _apply(self, grid, transform):
+        """
+        Применяет преобразование к сетке.
+
+        Args:
+            grid (list[list[int]]): Сетка Судоку.
+            transform (tuple): Преобразование (transposed, rows, cols, mapping).
+
+        Returns:
+            list[list[int]]: Преобразованная сетка.
+        """
+        transposed, rows, cols, mapping = transform
+        source = [list(row) for row in zip(*grid)] if transposed else grid
+        return [[mapping.get(source[r][c], 0) for c in cols] for r in rows]
+
+    def _invert(self, grid, transform):
+        """
+        Применяет к сетке преобразование, обратное transform.
+
+        Args:
+            grid (list[list[int]] | tuple[tuple[int]]): Сетка в канонических координатах и числах.
+            transform (tuple): Преобразование (transposed, rows, cols, mapping).
+
+        Returns:
+            list[list[int]]: Сетка в координатах и числах исходной головоломки.
+        """
+        transposed, rows, cols, mapping = transform
+        inverse = {label: num for num, label in mapping.items()}
+        result = [[0] * self.size for _ in range(self.size)]
+        for i, r in enumerate(rows):
+            for j, c in enumerate(cols):
+                result[r][c] = inverse.get(grid[i][j], 0)
+        if transposed:
+            result = [list(row) for row in zip(*result)]
+        return result
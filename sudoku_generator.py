@@ -8,14 +8,36 @@ Attributes:
     region_size (int): Размер подрегиона (2 для 4x4, 3 для 9x9).
     grid (list[list[int]]): Сетка с текущей версией головоломки Судоку.
     solved_grid (list[list[int]]): Полностью решённая версия сетки Судоку.
+    deadline (float | None): Момент времени (по time.monotonic()), после которого генерация прерывается.
+    cancel_event (threading.Event | None): Событие отмены генерации.
+    progress (callable | None): Функция, получающая долю выполненной работы (от 0 до 1).
+    Последние три атрибута задаются только на время вызова generate.
 
 Methods:
-    generate(difficulty):
+    generate(difficulty, deadline, progress, cancel_event):
         Генерирует головоломку Судоку заданного уровня сложности.
     
     _fill_grid():
         Заполняет сетку числами, чтобы получить полностью решённую версию Судоку.
     
+    _fallback_grid():
+        Возвращает решённую сетку из кэша или базового шаблона, если генерация прервана.
+    
+    _transform(grid):
+        Перемешивает решённую сетку преобразованиями, сохраняющими правила Судоку.
+    
+    _should_stop():
+        Проверяет, истёк ли срок генерации или была ли она отменена.
+    
+    _remember_solved_grid():
+        Сохраняет решённую сетку в кэш для _fallback_grid.
+    
+    _report_progress(fraction):
+        Сообщает о ходе генерации через функцию progress.
+    
+    _report_fill_progress():
+        Сообщает о ходе заполнения сетки во время перебора.
+    
     _remove_numbers(difficulty):
         Удаляет случайные числа из сетки, чтобы создать головоломку с пробелами.
     
@@ -25,13 +47,20 @@ Methods:
     _solve():
         Использует метод backtracking для решения сетки Судоку.
     
+    _count_solutions(limit, solutions):
+        Считает количество решений сетки, останавливаясь на limit.
+    
     _find_empty_cell():
         Ищет первую пустую ячейку (со значением 0) и возвращает её координаты.
 """
 import random
+import time
 
 class SudokuGenerator:
     """Класс для генерации и создания головоломок Судоку."""
+    _solved_cache = {}  # Кэш решённых сеток по размеру: {size: [grid, ...]}
+    _cache_limit = 20  # Максимальное количество сеток одного размера в кэше
+
     def __init__(self, size):
         """
         Инициализирует генератор Судоку.
@@ -44,27 +73,59 @@ class SudokuGenerator:
             region_size (int): Размер подрегиона (2 для 4x4, 3 для 9x9).
             grid (list[list[int]]): Сетка с текущей версией головоломки Судоку.
             solved_grid (list[list[int]]): Полностью решённая версия сетки.
+            deadline (float | None): Срок генерации по time.monotonic() (только во время generate).
+            cancel_event (threading.Event | None): Событие отмены генерации (только во время generate).
+            progress (callable | None): Функция для сообщения о ходе генерации (только во время generate).
         """
         self.size = size
         self.region_size = int(size ** 0.5)
         self.grid = [[0] * size for _ in range(size)]
         self.solved_grid = []   
+        self.deadline = None
+        self.cancel_event = None
+        self.progress = None
+        self._solve_steps = 0  # Счётчик вызовов _solve для редкого сообщения о прогрессе
+        self._filled_max = 0  # Наибольшее количество заполненных ячеек за время перебора
 
-    def generate(self, difficulty):
+    def generate(self, difficulty, deadline=None, progress=None, cancel_event=None):
         """
         Генерирует головоломку Судоку с заданным уровнем сложности.
 
         Заполняет сетку полностью и затем удаляет из неё числа в зависимости от сложности.
+        Если заполнение не успело завершиться до deadline или было отменено через cancel_event,
+        решённая сетка берётся из кэша (или базового шаблона) и перемешивается.
+        После завершения deadline, progress и cancel_event сбрасываются, чтобы не влиять
+        на последующие вызовы _solve.
 
         Args:
             difficulty (str): Уровень сложности ('Легкий', 'Средний' или 'Сложный').
+            deadline (float | None): Срок генерации по time.monotonic(); None — без ограничения.
+            progress (callable | None): Функция, получающая долю выполненной работы (от 0 до 1).
+            cancel_event (threading.Event | None): Событие, установка которого прерывает заполнение.
 
         Returns:
             list[list[int]]: Двумерный массив с частично заполненной сеткой Судоку.
         """
-        self._fill_grid()  # Полностью заполняем судоку (полная версия)
-        self.solved_grid = [row[:] for row in self.grid]  # Сохраняем решённую версию
-        self._remove_numbers(difficulty)  # Удаляем числа в зависимости от сложности
+        self.deadline = deadline
+        self.progress = progress
+        self.cancel_event = cancel_event
+        self._solve_steps = 0
+        self._filled_max = 0
+        try:
+            self._report_progress(0)
+
+            if not self._fill_grid():  # Полностью заполняем судоку (полная версия)
+                self.grid = self._fallback_grid()  # Не успели — берём готовую сетку
+            self.solved_grid = [row[:] for row in self.grid]  # Сохраняем решённую версию
+            self._remember_solved_grid()
+            self._report_progress(0.9)
+
+            self._remove_numbers(difficulty)  # Удаляем числа в зависимости от сложности
+            self._report_progress(1)
+        finally:
+            self.deadline = None
+            self.progress = None
+            self.cancel_event = None
         return self.grid
 
     def _fill_grid(self):
@@ -73,10 +134,121 @@ class SudokuGenerator:
 
         Используется метод backtracking для заполнения всех ячеек сетки.
         
+        Returns:
+            bool: True, если сетка заполнена; False, если заполнение прервано.
+        """
+        return self._solve()
+
+    def _fallback_grid(self):
+        """
+        Возвращает решённую сетку, не выполняя перебор.
+
+        Берётся случайная сетка из кэша ранее сгенерированных; если кэш пуст, используется
+        базовый шаблон. В обоих случаях сетка перемешивается методом _transform.
+
+        Returns:
+            list[list[int]]: Полностью решённая сетка Судоку.
+        """
+        cached = self._solved_cache.get(self.size)
+        if cached:
+            return self._transform(random.choice(cached))
+
+        n = self.region_size
+        base = [[(n * (row % n) + row // n + col) % self.size + 1 for col in range(self.size)]
+                for row in range(self.size)]
+        return self._transform(base)
+
+    def _transform(self, grid):
+        """
+        Перемешивает решённую сетку преобразованиями, сохраняющими правила Судоку.
+
+        Применяются перестановка чисел, перестановки строк внутри полос и самих полос,
+        перестановки столбцов внутри стопок и самих стопок, а также транспонирование.
+
+        Args:
+            grid (list[list[int]]): Решённая сетка Судоку.
+
+        Returns:
+            list[list[int]]: Новая решённая сетка Судоку.
+        """
+        n = self.region_size
+
+        def shuffled_lines():
+            bands = list(range(n))
+            random.shuffle(bands)
+            lines = []
+            for band in bands:
+                inner = list(range(n))
+                random.shuffle(inner)
+                lines.extend(band * n + i for i in inner)
+            return lines
+
+        digits = list(range(1, self.size + 1))
+        random.shuffle(digits)
+        rows = shuffled_lines()
+        cols = shuffled_lines()
+
+        result = [[digits[grid[r][c] - 1] for c in cols] for r in rows]
+        if random.random() < 0.5:
+            result = [list(row) for row in zip(*result)]  # Транспонирование
+        return result
+
+    def _remember_solved_grid(self):
+        """
+        Сохраняет решённую сетку в кэш для последующего использования в _fallback_grid.
+
         Returns:
             None
         """
-        self._solve()
+        cached = self._solved_cache.setdefault(self.size, [])
+        if len(cached) >= self._cache_limit:
+            cached.pop(0)
+        cached.append([row[:] for row in self.solved_grid])
+
+    def _should_stop(self):
+        """
+        Проверяет, нужно ли прервать перебор.
+
+        Returns:
+            bool: True, если истёк срок генерации или генерация отменена; иначе False.
+        """
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def _report_progress(self, fraction):
+        """
+        Сообщает о ходе генерации, если задана функция progress.
+
+        Args:
+            fraction (float): Доля выполненной работы (от 0 до 1).
+
+        Returns:
+            None
+        """
+        if self.progress is not None:
+            self.progress(fraction)
+
+    def _report_fill_progress(self):
+        """
+        Сообщает о ходе заполнения сетки во время перебора.
+
+        Вызывается из _solve, но сетка просматривается только раз в 256 вызовов.
+        Прогресс — наибольшая доля заполненных ячеек за время перебора (до 0.9),
+        поэтому индикатор не откатывается назад при возврате backtracking.
+
+        Returns:
+            None
+        """
+        if self.progress is None:
+            return
+        self._solve_steps += 1
+        if self._solve_steps % 256:
+            return
+        filled = sum(1 for row in self.grid for num in row if num)
+        if filled > self._filled_max:
+            self._filled_max = filled
+            self._report_progress(0.9 * filled / (self.size * self.size))
 
     def _remove_numbers(self, difficulty):
         """
@@ -95,7 +267,9 @@ class SudokuGenerator:
         total_cells = self.size * self.size
         cells_to_remove = total_cells // 2 if difficulty == 'Легкий' else total_cells * 2 // 3
         
-        for _ in range(cells_to_remove):
+        for removed in range(cells_to_remove):
+            if removed % self.size == 0:
+                self._report_progress(0.9 + 0.1 * removed / cells_to_remove)
             while True:
                 row = random.randint(0, self.size - 1)
                 col = random.randint(0, self.size - 1)
@@ -141,9 +315,15 @@ class SudokuGenerator:
         
         Используется для заполнения пустой сетки Судоку числами.
 
+        Перебор прерывается (с возвратом False), если истёк срок генерации или она отменена.
+
         Returns:
-            bool: True, если Судоку решена; False, если решение не найдено.
+            bool: True, если Судоку решена; False, если решение не найдено или перебор прерван.
         """
+        if self._should_stop():
+            return False
+        self._report_fill_progress()
+
         empty_cell = self._find_empty_cell()
         if not empty_cell:
             return True  # Нет пустых клеток — судоку решено
@@ -161,6 +341,39 @@ class SudokuGenerator:
 
         return False
 
+    def _count_solutions(self, limit=2, solutions=None):
+        """
+        Считает количество решений текущей сетки методом backtracking.
+
+        Перебор прекращается, как только найдено limit решений: для проверки
+        единственности решения достаточно limit=2. Сетка после вызова остаётся без изменений.
+
+        Args:
+            limit (int): Максимальное количество решений, которое нужно найти.
+            solutions (list | None): Если передан пустой список, в него добавляется копия
+                первого найденного решения, чтобы не искать его повторно через _solve.
+
+        Returns:
+            int: Количество найденных решений (не больше limit).
+        """
+        empty_cell = self._find_empty_cell()
+        if not empty_cell:
+            if solutions is not None and not solutions:
+                solutions.append([row[:] for row in self.grid])
+            return 1
+
+        row, col = empty_cell
+        count = 0
+        for num in range(1, self.size + 1):
+            if self._is_valid_placement(row, col, num):
+                self.grid[row][col] = num
+                count += self._count_solutions(limit - count, solutions)
+                self.grid[row][col] = 0
+                if count >= limit:
+                    break
+
+        return count
+
     def _find_empty_cell(self):
         """
         Ищет первую пустую ячейку (со значением 0) в сетке.
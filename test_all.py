@@ -1,8 +1,26 @@
+import multiprocessing
+import queue
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 from menu_backend import MenuBackend
 from game_backend import GameBackend
+from game_frontend import GameFrontend
 from sudoku_generator import SudokuGenerator
+import parallel_solver
+from parallel_solver import ParallelSolver
+from puzzle_index import PuzzleIndex
+
+_unit_calls = multiprocessing.Value('i', 0)  # Счётчик заданий, взятых процессами пула
+_original_solve_unit = parallel_solver._solve_unit
+
+def _counting_solve_unit(grid):
+    """Считает вызовы _solve_unit в процессах пула и замедляет каждое задание"""
+    with _unit_calls.get_lock():
+        _unit_calls.value += 1
+    time.sleep(0.2)
+    return _original_solve_unit(grid)
 
 class TestMenuBackend(unittest.TestCase):
     """Тесты для класса MenuBackend, который управляет настройками игры"""
@@ -55,6 +73,55 @@ class TestGameBackend(unittest.TestCase):
         self.assertIsNotNone(hint)
         self.assertEqual(self.backend.hint_count, 1)
 
+class TestGameFrontend(unittest.TestCase):
+    """Тесты потока генерации GameFrontend (без создания окна Tk)"""
+    def setUp(self):
+        self.frontend = GameFrontend.__new__(GameFrontend)
+        self.frontend.difficulty = 'Легкий'
+        self.frontend.size_name = '4x4'
+        self.frontend.generation_queue = queue.Queue()
+        self.frontend.cancel_event = threading.Event()
+
+    def test_generate_done(self):
+        """Проверяет, что после генерации в очередь передаётся GameBackend"""
+        self.frontend._generate()
+        messages = []
+        while not self.frontend.generation_queue.empty():
+            messages.append(self.frontend.generation_queue.get())
+        self.assertEqual(messages[-1][0], 'done')
+        self.assertIsInstance(messages[-1][1], GameBackend)
+
+    @patch('menu_frontend.MenuFrontend')
+    @patch('game_frontend.threading.Thread')
+    @patch('game_frontend.ttk')
+    @patch('game_frontend.tk')
+    def test_close_window_exits(self, mock_tk, mock_ttk, mock_thread, mock_menu):
+        """Проверяет, что закрытие окна во время генерации не открывает меню заново"""
+        self.frontend.root = MagicMock()
+        self.frontend.start_generation()
+        self.frontend.root.protocol.assert_called_with("WM_DELETE_WINDOW", self.frontend.close_window)
+
+        self.frontend.close_window()
+        self.assertTrue(self.frontend.cancel_event.is_set())
+        self.frontend.root.destroy.assert_called_once()
+        mock_menu.assert_not_called()
+
+    @patch('menu_frontend.MenuFrontend')
+    def test_cancel_returns_to_menu(self, mock_menu):
+        """Проверяет, что кнопка «Отмена» возвращает пользователя в меню"""
+        self.frontend.root = MagicMock()
+        self.frontend.cancel_generation()
+        self.assertTrue(self.frontend.cancel_event.is_set())
+        mock_menu.return_value.run.assert_called_once()
+
+    @patch('game_frontend.GameBackend', side_effect=ValueError('сбой'))
+    def test_generate_error(self, mock_backend):
+        """Проверяет, что ошибка генерации передаётся в очередь, а не теряется"""
+        self.frontend._generate()
+        message, value = self.frontend.generation_queue.get_nowait()
+        self.assertEqual(message, 'error')
+        self.assertIsInstance(value, ValueError)
+
 class TestSudokuGenerator(unittest.TestCase):
     def setUp(self):
         """Создаёт экземпляр MenuBackend для использования в тестах"""
@@ -88,5 +155,212 @@ class TestSudokuGenerator(unittest.TestCase):
         self.assertTrue(self.generator._solve())
         self.assertNotIn(0, [num for row in self.generator.grid for num in row])
 
+    def test_count_solutions(self):
+        """Проверяет, что _count_solutions останавливается на limit и не меняет сетку"""
+        self.generator.grid = [
+            [1, 2, 3, 4],
+            [3, 4, 1, 2],
+            [2, 1, 4, 3],
+            [4, 3, 2, 0],
+        ]
+        solutions = []
+        self.assertEqual(self.generator._count_solutions(solutions=solutions), 1)
+        self.assertEqual(solutions[0][3][3], 1)
+        self.generator.grid = [[0] * 4 for _ in range(4)]
+        self.assertEqual(self.generator._count_solutions(2), 2)
+        self.assertEqual(self.generator.grid, [[0] * 4 for _ in range(4)])
+
+    def assertSolvedGrid(self, grid):
+        """Проверяет, что сетка полностью и правильно заполнена"""
+        size = len(grid)
+        n = int(size ** 0.5)
+        digits = list(range(1, size + 1))
+        for i in range(size):
+            self.assertEqual(sorted(grid[i]), digits)
+            self.assertEqual(sorted(row[i] for row in grid), digits)
+            box = [grid[(i // n) * n + r][(i % n) * n + c] for r in range(n) for c in range(n)]
+            self.assertEqual(sorted(box), digits)
+
+    def test_generate_deadline_fallback(self):
+        """Проверяет, что при истёкшем сроке генерация возвращает готовую сетку"""
+        generator = SudokuGenerator(9)
+        generator.generate('Легкий', deadline=time.monotonic() - 1)
+        self.assertSolvedGrid(generator.solved_grid)
+
+    def test_generate_cancel(self):
+        """Проверяет, что отменённая генерация не зависает и возвращает сетку"""
+        cancel_event = threading.Event()
+        cancel_event.set()
+        grid = self.generator.generate('Сложный', cancel_event=cancel_event)
+        self.assertEqual(len(grid), 4)
+        self.assertSolvedGrid(self.generator.solved_grid)
+
+    def test_generate_progress(self):
+        """Проверяет, что о ходе генерации сообщается от 0 до 1"""
+        reported = []
+        self.generator.generate('Легкий', progress=reported.append)
+        self.assertEqual(reported[0], 0)
+        self.assertEqual(reported[-1], 1)
+        self.assertEqual(reported, sorted(reported))
+
+    def test_fill_progress(self):
+        """Проверяет, что во время перебора сообщается доля заполненных ячеек"""
+        reported = []
+        self.generator.progress = reported.append
+        self.generator.grid = [
+            [1, 2, 0, 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, 0],
+        ]
+        for _ in range(256):
+            self.generator._report_fill_progress()
+        self.assertEqual(reported, [0.9 * 2 / 16])
+
+    def test_generate_resets_deadline(self):
+        """Проверяет, что истёкший срок генерации не мешает последующим вызовам _solve"""
+        cancel_event = threading.Event()
+        cancel_event.set()
+        self.generator.generate('Легкий', deadline=time.monotonic() - 1,
+                                progress=lambda fraction: None, cancel_event=cancel_event)
+        self.assertIsNone(self.generator.deadline)
+        self.assertIsNone(self.generator.progress)
+        self.assertIsNone(self.generator.cancel_event)
+        self.generator.grid = [[0] * 4 for _ in range(4)]
+        self.assertTrue(self.generator._solve())
+
+    def test_transform(self):
+        """Проверяет, что _transform сохраняет правильность решённой сетки"""
+        self.generator.generate('Легкий')
+        self.assertSolvedGrid(self.generator._transform(self.generator.solved_grid))
+
+class TestParallelSolver(unittest.TestCase):
+    """Тесты для параллельного решателя ParallelSolver"""
+    def setUp(self):
+        self.solver = ParallelSolver(processes=2)
+        self.grid = [
+            [1, 0, 0, 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, 0],
+        ]
+
+    def test_solve(self):
+        """Проверяет, что решение корректно и сохраняет исходные числа"""
+        solution = self.solver.solve(self.grid)
+        self.assertEqual(solution[0][0], 1)
+        generator = SudokuGenerator(4)
+        for row in range(4):
+            for col in range(4):
+                num = solution[row][col]
+                generator.grid = [r[:] for r in solution]
+                generator.grid[row][col] = 0
+                self.assertTrue(generator._is_valid_placement(row, col, num))
+        self.assertEqual(self.grid[1], [0, 0, 0, 0])  # Исходная сетка не меняется
+
+    def test_count_solutions(self):
+        """Проверяет подсчёт решений до limit"""
+        self.assertEqual(self.solver.count_solutions(self.grid, limit=2), 2)
+        solved = [
+            [1, 2, 3, 4],
+            [3, 4, 1, 2],
+            [2, 1, 4, 3],
+            [4, 3, 2, 1],
+        ]
+        self.assertEqual(self.solver.count_solutions(solved), 1)
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == 'fork', 'счётчик передаётся процессам через fork')
+    def test_solve_stops_early(self):
+        """Проверяет, что после первого решения пул останавливается, не взяв все задания"""
+        units = self.solver._split(self.grid)
+        _unit_calls.value = 0
+        with patch.object(parallel_solver, '_solve_unit', _counting_solve_unit):
+            solution = self.solver.solve(self.grid)
+        time.sleep(0.3)  # Даём остановленным процессам время, если бы они продолжали работу
+        self.assertIsNotNone(solution)
+        self.assertLess(_unit_calls.value, len(units))
+
+    def test_unsolvable(self):
+        """Проверяет, что для сетки без решения возвращается None"""
+        grid = [
+            [0, 2, 3, 4],
+            [1, 0, 0, 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, 0],
+        ]
+        self.assertIsNone(self.solver.solve(grid))
+        self.assertEqual(self.solver.count_solutions(grid), 0)
+
+class TestPuzzleIndex(unittest.TestCase):
+    """Тесты для индекса головоломок PuzzleIndex"""
+    def setUp(self):
+        self.index = PuzzleIndex(4)
+        self.puzzle = [
+            [1, 0, 0, 0],
+            [0, 0, 3, 0],
+            [0, 4, 0, 0],
+            [0, 0, 0, 2],
+        ]
+        # Транспонирование, перестановка полос, строк, столбцов и чисел
+        self.transform = (True, (3, 2, 0, 1), (1, 0, 2, 3), {1: 3, 2: 1, 3: 4, 4: 2})
+        self.equivalent = self.index._apply(self.puzzle, self.transform)
+
+    def test_canonicalize(self):
+        """Проверяет, что эквивалентные головоломки имеют одну каноническую форму"""
+        canonical, transform = self.index.canonicalize(self.puzzle)
+        self.assertNotEqual(self.equivalent, self.puzzle)
+        self.assertEqual(self.index.canonicalize(self.equivalent)[0], canonical)
+        self.assertEqual(self.index._apply(self.puzzle, transform), [list(row) for row in canonical])
+        self.assertEqual(self.index._invert(canonical, transform), self.puzzle)
+
+    def test_canonicalize_sparse_9x9(self):
+        """Проверяет, что разреженные сетки 9x9 канонизируются быстро и одинаково для эквивалентных"""
+        index = PuzzleIndex(9)
+        sparse = [[0] * 9 for _ in range(9)]
+        sparse[0][0] = 5
+        sparse[4][7] = 2
+        # Транспонирование, перестановки полос, строк, столбцов и чисел
+        transform = (True, (4, 3, 5, 8, 6, 7, 1, 0, 2), (2, 0, 1, 6, 7, 8, 3, 5, 4),
+                     {1: 9, 2: 4, 3: 1, 4: 2, 5: 7, 6: 3, 7: 8, 8: 6, 9: 5})
+        equivalent = index._apply(sparse, transform)
+
+        start = time.monotonic()
+        canonical = index.canonicalize(sparse)[0]
+        self.assertEqual(index.canonicalize(equivalent)[0], canonical)
+        index.canonicalize([[0] * 9 for _ in range(9)])
+        self.assertLess(time.monotonic() - start, 2)
+
+    def test_deduplicate(self):
+        """Проверяет, что из эквивалентных головоломок остаётся одна"""
+        other = [
+            [1, 2, 0, 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, 0],
+        ]
+        unique = self.index.deduplicate([self.puzzle, self.equivalent, other])
+        self.assertEqual(unique, [self.puzzle, other])
+        self.assertEqual(len(self.index), 2)
+        self.assertIn(self.equivalent, self.index)
+
+    def test_solve_cached(self):
+        """Проверяет, что результат решения переиспользуется для эквивалентной головоломки"""
+        with patch.object(SudokuGenerator, '_solve') as mock_solve:
+            result = self.index.solve(self.puzzle)
+            mock_solve.assert_not_called()  # Решение берётся из подсчёта, второй перебор не нужен
+        self.assertEqual(result['solution_count'], 1)
+        self.assertEqual(result['difficulty'], 'Сложный')
+
+        with patch.object(PuzzleIndex, '_solve_canonical') as mock_solve:
+            cached = self.index.solve(self.equivalent)
+            mock_solve.assert_not_called()
+
+        self.assertEqual(cached['solution'], self.index._apply(result['solution'], self.transform))
+        for grid, solution in ((self.puzzle, result['solution']), (self.equivalent, cached['solution'])):
+            for row in range(4):
+                for col in range(4):
+                    if grid[row][col]:
+                        self.assertEqual(solution[row][col], grid[row][col])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file